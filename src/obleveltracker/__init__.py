@@ -13,12 +13,18 @@
 # pylint: disable=bad-docstring-quotes,invalid-name
 __version__="0.2.0"
 
-import tkinter as tk
+__all__ = ('LocalDataFrame',
+           'LocalDataDialog',
+           'LocalButtonFrame',
+           'LocalTableDialog',
+           'SideBySideDialog',
+           'askinteger',
+           'askstring',)
 
-from .datadialogs import (LocalDataFrame,
-                          LocalDataDialog,
-                          LocalButtonFrame,
-                          LocalTableDialog,
-                          SideBySideDialog,
-                          askinteger,
-                          askstring,)
+
+def __getattr__(name):
+    # Import the tkinter dialogs on first use so importing the package does not load tkinter
+    if name in __all__:
+        from . import datadialogs
+        return getattr(datadialogs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
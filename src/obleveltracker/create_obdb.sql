@@ -33,6 +33,8 @@
         UNIQUE(SKILLID, level),
         FOREIGN KEY(SKILLID) REFERENCES obSkills(ROWID)
         );
+    CREATE INDEX IF NOT EXISTS obStatsLevel ON obStats(level, SKILLID);
+    CREATE INDEX IF NOT EXISTS obAttrsLevel ON obAttrs(level, ATTRID);
     CREATE VIEW skillMap AS SELECT
         a.ROWID,
         a.class as SkillGroup,
@@ -12,59 +12,65 @@
 
 # pylint: disable=bad-docstring-quotes,invalid-name
 import tkinter as tk
+from functools import lru_cache, partial
+from tkinter import font as tkfont
 from tkinter import messagebox
 
-import pandastable as pt
-
 
 def _getShape(shape=(1, 1), data=None):
     if data is None:
         return shape
-    elif  hasattr(data, 'shape'):  # get the shape from the data list
-        shape = data.shape()
-    elif len(data) > 0:  # compute the shape of the list
-        if isinstance(data[0], (list, tuple)):
-            shape = (len(data), len(data[0]))
+    dataShape = getattr(data, 'shape', None)
+    if dataShape is not None:  # shape is an attribute on arrays and frames, not a method
+        return dataShape() if callable(dataShape) else dataShape
+    nrows = len(data)
+    if nrows == 0:
+        return shape
+    first = data[0]
+    if isinstance(first, (list, tuple)):  # compute the shape of the list
+        return (nrows, len(first))
+    return (nrows, 0)
+
+
+@lru_cache(maxsize=None)
+def _coerce(dtype):
+    """ Converter for a LocalDialog dtype; unknown types are returned as strings """
+    return {'integer': int, 'float': float, 'complex': complex, 'str': str}.get(dtype, str)
+
+
+def _getRuns(indices):
+    """ Group ascending indices into [first, last] runs of consecutive values """
+    runs = []
+    for idx in indices:
+        if runs and idx == runs[-1][1] + 1:
+            runs[-1][1] = idx
         else:
-            shape = (len(data), 0)
-    return(shape)
+            runs.append([idx, idx])
+    return runs
 
 
-def _getValue(*args, **kw):
-    """ Return a default value if the row,col entry does not exist in the data
-    
-    Args:
-       data (list) : Data set to be searched
-       row (int)   : Row of data to be searched
-       col (int)   : Col of data to be searched (if 2D data set)
-       default     : Default value to be returned if data requested not in data set
-                   default = None
-    
-    Exceptions:
-        Suppresses IndexError and returns default data value
-        
-    Returns:
-        data[row][col] or default
-    """
-    if args and len(args) == 1:
-        (row, col, data) = (kw.get('row'), kw.get('col', kw.get('column')), args[0])
-    else:
-        (row, col, data) = (kw.get('row'), kw.get('col', kw.get('column')), kw.get('data'))
-            
-    if isinstance(data, (list, tuple)) and (row is not None or col is not None):
-        try:
-            if row is None:
-                return data[col]
-            elif col is None:
-                return data[row]
-            else:
-                return data[row][col]
-        except IndexError:
-            return kw.get('default')                        
-    else:
-        return kw.get('default')     
+def _get1d(data, idx, default=None):
+    """ Return data[idx], or default if data is empty or the index does not exist """
+    if not data:
+        return default
+    try:
+        return data[idx]
+    except (IndexError, TypeError):
+        return default
+
+
+def _get2d(data, row, col, default=None):
+    """ Return data[row][col], or data[(row, col)] for a sparse dict, or default if the entry does not exist """
+    if not data:
+        return default
+    if isinstance(data, dict):
+        return data.get((row, col), default)
+    try:
+        return data[row][col]
+    except (IndexError, TypeError):
+        return default
+
 
-        
 def _place_window(w, parent=None):
     """ Based on the tkinter.filedialog module
         useful to place a window at center of the parent window
@@ -143,29 +149,48 @@ class SideBySideDialog():
         self._popup = None
         self._rightlist = None
         self._leftlist = None
+        self._rightdirty = True
+        self._leftdirty = True
+        self._buttonspending = False
+        self._mrstate = None
+        self._mlstate = None
         return
                 
     def _moveright(self, *args):  # Include *args to allow use as double click event handler
-        selected_checkboxs = self._leftlist.curselection() 
-        
-        for selected_checkbox in selected_checkboxs[::-1]: 
-            self._rightlist.insert(tk.END, self._leftlist.get(selected_checkbox))
-            self._leftlist.delete(selected_checkbox)
-        self._setup_buttons()
+        if self._maxright > 0 and self._rightlist.size() >= self._maxright:
+            return  # Right side is full
+        self._moveselected(self._leftlist, self._rightlist)
 
     def _moveleft(self, *args):  # Include *args to allow use as double click event handler
-        selected_checkboxs = self._rightlist.curselection() 
-        
-        for selected_checkbox in selected_checkboxs[::-1]: 
-            self._leftlist.insert(tk.END, self._rightlist.get(selected_checkbox))
-            self._rightlist.delete(selected_checkbox)
+        self._moveselected(self._rightlist, self._leftlist)
+
+    def _moveselected(self, source, dest):
+        # One insert for all the selected items and one delete per contiguous run of them
+        selected = source.curselection()
+        if not selected:
+            return  # Nothing moved so the buttons are unchanged
+        if len(selected) == 1:  # The usual case with selectmode=SINGLE
+            dest.insert(tk.END, source.get(selected[0]))
+            source.delete(selected[0])
+        else:
+            items = source.get(0, tk.END)
+            dest.insert(tk.END, *[items[idx] for idx in selected])
+            for (first, last) in reversed(_getRuns(selected)):
+                source.delete(first, last)
         self._setup_buttons()
 
     def _setuplists(self):
-        for item in self._right: 
-            self._rightlist.insert(tk.END, item) 
-        for item in self._left: 
-            self._leftlist.insert(tk.END, item)
+        # Only reload a side whose list was replaced since it was last loaded
+        if self._rightdirty:
+            self._rightlist.delete(0, tk.END)
+            if self._right:
+                self._rightlist.insert(tk.END, *self._right)
+            self._rightdirty = False
+        if self._leftdirty:
+            self._leftlist.delete(0, tk.END)
+            if self._left:
+                self._leftlist.insert(tk.END, *self._left)
+            self._leftdirty = False
         self._setup_buttons()
         
     def _buildform(self):
@@ -187,6 +212,11 @@ class SideBySideDialog():
             self._rightlist.grid(row=0, column=2, rowspan=2, sticky='nsew') 
             self._leftlist = tk.Listbox(self._popup, selectmode=tk.SINGLE)
             self._leftlist.grid(row=0, column=0, rowspan=2, sticky='nsew')
+            self._rightlist.bind('<Double-1>', self._moveleft)
+            self._leftlist.bind('<Double-1>', self._moveright)
+            self._donevar = tk.BooleanVar(self._popup)
+            self._rightdirty = self._leftdirty = True
+            self._mrstate = self._mlstate = None
             self._setuplists()
  
             self._popup.columnconfigure(0, weight=1,)
@@ -196,23 +226,27 @@ class SideBySideDialog():
             
             self._popup.protocol("WM_DELETE_WINDOW", self._cancel)
             self._popup.takefocus = True
-            self._popup.grab_set()
-            _place_window(self._popup, self.parent)
         return self._popup
 
     def _setup_buttons(self):
-        if self._rightlist.size() > 0:
-            self._moveleftbutton['state'] = tk.NORMAL
-            self._rightlist.bind('<Double-1>', self._moveleft)
-        else:
-            self._moveleftbutton['state'] = tk.DISABLED
-            self._rightlist.unbind('<Double-1>')
-        if self._maxright > 0 and self._rightlist.size() >= self._maxright:
-            self._moverightbutton['state'] = tk.DISABLED
-            self._leftlist.unbind('<Double-1>')
-        else:
-            self._moverightbutton['state'] = tk.NORMAL
-            self._leftlist.bind('<Double-1>', self._moveright)
+        # Coalesce repeated requests into one update when the event loop is idle
+        if not self._buttonspending:
+            self._buttonspending = True
+            self._popup.after_idle(self._setup_buttons_now)
+
+    def _setup_buttons_now(self):
+        self._buttonspending = False
+        if self._popup is None:
+            return
+        size = self._rightlist.size()
+        mlstate = tk.NORMAL if size > 0 else tk.DISABLED
+        if mlstate != self._mlstate:
+            self._mlstate = mlstate
+            self._moveleftbutton.configure(state=mlstate)
+        mrstate = tk.DISABLED if self._maxright > 0 and size >= self._maxright else tk.NORMAL
+        if mrstate != self._mrstate:
+            self._mrstate = mrstate
+            self._moverightbutton.configure(state=mrstate)
 
     @property
     def right(self):
@@ -221,6 +255,8 @@ class SideBySideDialog():
     
     @right.setter
     def right(self, rightlist:list):
+        if list(rightlist) != list(self._right):
+            self._rightdirty = True
         self._right = rightlist
     
     @property
@@ -230,6 +266,8 @@ class SideBySideDialog():
 
     @left.setter
     def left(self, leftlist:list):
+        if list(leftlist) != list(self._left):
+            self._leftdirty = True
         self._left = leftlist
         
     @property
@@ -240,20 +278,23 @@ class SideBySideDialog():
     def maxright(self, maxright:int):
         self._maxright = maxright
         
-    def _save(self):
-        if self._rightlist is not None:
-            self._right = self._rightlist.get(0, tk.END)
-        if self._leftlist is not None:
-            self._left = self._leftlist.get(0, tk.END)
-        self._popup.destroy()
-        self._popup = None
-        self._resp = True
+    def _save(self, *args):  # Include *args to allow use as hot key event handler
+        self._right = self._rightlist.get(0, tk.END)
+        self._left = self._leftlist.get(0, tk.END)
+        self._close(True)
 
-    def _cancel(self):
+    def _cancel(self, *args):
         if messagebox.askokcancel('Cancel', 'Cancel?'):
-            self._popup.destroy()
-            self._popup = None
-            self._resp = False
+            # The listboxes may hold moves that were not saved, so reload both on the next show
+            self._rightdirty = self._leftdirty = True
+            self._close(False)
+
+    def _close(self, resp):
+        # Hide rather than destroy the popup so the next show reuses its widgets
+        self._resp = resp
+        self._popup.grab_release()
+        self._popup.withdraw()
+        self._donevar.set(True)
 
     def show(self, right=None, left=None, maxright=None):
         """Display the lists side by side for selection.
@@ -277,15 +318,19 @@ class SideBySideDialog():
         Returns:
             Boolean : True if OK, False if Cancel
         """
-        if right is not None: self._right = right
-        if left is not None: self._left = left
+        if right is not None: self.right = right
+        if left is not None: self.left = left
         if maxright is not None: self._maxright = maxright
         if self._popup is None:
             self._popup = self._buildform()
-        else:
+        elif self._rightdirty or self._leftdirty:
             self._setuplists()
-        if self._popup.state() in [ 'withdrawn', 'iconic' ]: self._popup.deiconify()
-        self.parent.wait_window(self._popup)
+        else:
+            self._setup_buttons()  # maxright may have changed
+        self._donevar.set(False)
+        self._popup.grab_set()
+        _place_window(self._popup, self.parent)
+        self._popup.wait_variable(self._donevar)
         return self._resp
 
 
@@ -364,14 +409,8 @@ class LocalDialog():
         return self._popup
         
     def _okPress(self, *args):
-        _validator = {'integer':int, 'flaot': float, 'complex':complex}
         try:
-            if self._dtype == 'integer':
-                self._resp = _validator['integer'](self._entry.get())
-            elif self._dtype == 'float':
-                self._resp = float(self._entry.get())
-            else:
-                self._resp = self._entry.get()
+            self._resp = _coerce(self._dtype)(self._entry.get())
             self._popup.destroy()
         except ValueError as e:
             messagebox.showerror('ValueError', f'{self._entry.get()} is not {self._dtype}. Try Again\n{e}')
@@ -453,22 +492,22 @@ class LocalDataFrame(tk.Frame):
     """
 
     def __init__(self, parent=None, cnf:dict={}, shape=(1, 1), default=None, **kw):
-        if parent is None: parent = tk.Tk()
         tk.Frame.__init__(self, parent)
         values = kw.get('data', None)
         if 'data' in kw:
             del kw['data']
         if values is None:  # create data with shape given using default value
             if default == '{row}{col}': 
-                values = [ [f'({row},{col})' for col in range(shape[1])] for row in range(shape[0])]
+                colStrs = [f',{col})' for col in range(shape[1])]
+                values = [ [f'({row}' + colStr for colStr in colStrs] for row in range(shape[0])]
             elif default:
-                values = [ [default for col in range(shape[1])] for row in range(shape[0])]
+                values = [ [default] * shape[1] for _ in range(shape[0])]
             else:
                 values = [ [] ]
         self._data = values.copy()
         self._cnf = cnf
         self.configure(cnf)
-        self._fields = [[]]
+        self._fields = []
         self._editable = kw.get('editable', None)
         self._drawFrame(**kw)
         
@@ -477,62 +516,92 @@ class LocalDataFrame(tk.Frame):
         self._editable = self._editable or ('editable' in kw) or ('editcols' in kw) or ('editrows' in kw)
         values = kw.get('data', self._data)
         self._shape = (nrows, ncols) = (len(values), len(values[0]))  
-        for oldRow in self._fields:
-            for widget in oldRow:
-                widget.destroy()
-        self._fields = [[None for _ in range(ncols)] for _ in range(nrows)]
+        for widget in self._fields:
+            widget.destroy()
+        self._ncols = ncols
+        self._fields = [None] * (nrows * ncols)  # flat, indexed by row * ncols + col
+        wrapCols = kw.get('wrap', [])
+        wrapSet = frozenset(wrapCols)
+        widths = kw.get('widths', [])
+        # Resolve the per-column, per-row and per-cell settings once before building the widgets
+        colWidths = list(widths[:ncols]) + [None] * (ncols - len(widths))
+        rowColors = list(rowbg[:nrows]) + ['white'] * (nrows - len(rowbg))
+        self._data = cells = [list(rowValues[:ncols]) + [''] * (ncols - len(rowValues)) for rowValues in values]
+        self._entryCells = []  # (row, col, widget) for every editable field, read back by the data getter
+        editMask = bytearray(nrows * ncols)  # 1 for each editable cell, indexed by row * ncols + col
         if self._editable:
             editrows = kw.get('editrows', [])
             editcols = kw.get('editcols', [])
             editable = kw.get('editable', [])
             if (isinstance(editable, bool) or 
                  (len(editrows) == 0 and len(editcols) == 0 and len(editable) == 0)):
-                editable = [[True for _ in range(ncols)] for _ in range(nrows)]
-        wrapCols = kw.get('wrap', [])
-        widths = kw.get('widths', [])
+                editable = []
+                editMask[:] = b'\x01' * (nrows * ncols)
+            for row in frozenset(editrows):
+                if 0 <= row < nrows:
+                    editMask[row * ncols:(row + 1) * ncols] = b'\x01' * ncols
+            for col in frozenset(editcols):
+                if 0 <= col < ncols:
+                    editMask[col::ncols] = b'\x01' * nrows
+            for (row, flags) in enumerate(editable[:nrows]):
+                for (col, flag) in enumerate(flags[:ncols]):
+                    if flag:
+                        editMask[row * ncols + col] = 1
         for row in range(nrows):
+            (bg, rowCells, base) = (rowColors[row], cells[row], row * ncols)
             for col in range(ncols):
-                width = _getValue(widths, col=col, default=None)
-                if (self._editable and
-                     ((row in editrows) or (col in editcols) or _getValue(editable, row=row, col=col, default=False))):
-                    curValue = _getValue(values, row=row, col=col, default='')
+                curValue = rowCells[col]
+                if editMask[base + col]:
                     if isinstance(curValue, str):
                         justify = 'left'
                     else:
                         justify = 'center'
-                    if str(col) in wrapCols:
-                        self._fields[row][col] = tk.Text(self, font=self._font, wrap=tk.WORD, height=1,
-                                                          bg=_getValue(rowbg, row=row, default='white'))
-                        self._fields[row][col].insert(tk.INSERT, _getValue(values, row=row, col=col, default=''))
+                    if str(col) in wrapSet:
+                        field = tk.Text(self, font=self._font, wrap=tk.WORD, height=1, bg=bg)
+                        field.insert(tk.INSERT, curValue)
                     else:
-                        self._fields[row][col] = tk.Entry(self, justify=justify, font=self._font,
-                                                          bg=_getValue(rowbg, row=row, default='white'))
-                        self._fields[row][col].insert(0, _getValue(values, row=row, col=col, default=''))
-                    if width:
-                        self._fields[row][col]['width'] = width
+                        field = tk.Entry(self, justify=justify, font=self._font, bg=bg)
+                        field.insert(0, curValue)
+                    if colWidths[col]:
+                        field['width'] = colWidths[col]
+                    self._entryCells.append((row, col, field))
 
                 else: 
-                    self._fields[row][col] = tk.Label(self, anchor=anchor, pady=1, font=self._font,
-                                                      bg=_getValue(rowbg, row=row, default='white'),
-                                                      text=_getValue(values, row=row, col=col, default=''))
-                self._fields[row][col].grid(row=row, column=col, sticky='nsew', padx=1, pady=1)
-                self.grid(row=row, column=col, sticky='nsew')
-        for row in range(nrows):
-            self.rowconfigure(row, weight=1)
-        for col in range(ncols):
-            if col in wrapCols:
-                self.columnconfigure(col, weight=10)
-            else:
-                self.columnconfigure(col, weight=1)
+                    field = tk.Label(self, anchor=anchor, pady=1, font=self._font, bg=bg, text=curValue)
+                self._fields[base + col] = field
+                field.grid(row=row, column=col, sticky='nsew', padx=1, pady=1)
+        # grid accepts a list of indices, so each weight is set with a single Tcl call
+        if nrows:
+            self.rowconfigure(tuple(range(nrows)), weight=1)
+        wideCols = tuple(col for col in range(ncols) if col in wrapSet)
+        narrowCols = tuple(col for col in range(ncols) if col not in wrapSet)
+        if wideCols:
+            self.columnconfigure(wideCols, weight=10)
+        if narrowCols:
+            self.columnconfigure(narrowCols, weight=1)
     
     def _setField(self, row, col, value):
-        # Handle fields which can be either tk.Label or tk.Entry
-        field = self._fields[row][col]
+        # Handle fields which can be either tk.Label, tk.Entry or tk.Text
+        if not 0 <= col < self._ncols:  # the flat index would otherwise land on another row's field
+            raise IndexError(f'Column {col} out of range for {self._ncols} columns')
+        field = self._fields[row * self._ncols + col]
         if isinstance(field, tk.Entry):
             field.delete(0, tk.END)
             field.insert(0, value)
+        elif isinstance(field, tk.Text):
+            field.delete("1.0", tk.END)
+            field.insert("1.0", value)
         elif isinstance(field, tk.Label):
             field.configure(text=value)
+        self._data[row][col] = value
+
+    def _readEntries(self):
+        # Labels never change, so only the editable fields need to be read back
+        for (row, col, field) in self._entryCells:
+            if isinstance(field, tk.Text):
+                self._data[row][col] = field.get("1.0", tk.END)
+            else:
+                self._data[row][col] = field.get()
         
     def update(self, **kw):
         """ Update the displayed data
@@ -544,38 +613,44 @@ class LocalDataFrame(tk.Frame):
                             if not provided it is a full row update
             data (list) : the new values to display in the row
                             if row = col = None, then replace the entire dataset
+            rows (list)   : Optional list of (row, values) pairs to update several rows in one call
             default : the default value to use if values[row][col] does not exist
         
         Exceptions:
             Suppress IndexError if row, col are outside span of values and returns default
         """
         (row, col, values) = (kw.get('row'), kw.get('col', kw.get('column')), kw.get('data')) 
-        if col is None and row is None:  # data set replacement
+        if 'rows' in kw:  # batch of row replacements
+            for (row, rowValues) in kw['rows']:
+                for (col, value) in enumerate(rowValues):
+                    self._setField(row, col, value)
+        elif col is None and row is None:  # data set replacement
             self._drawFrame(**kw)                
         elif col is None:  # row replacement
             for col in range(len(values)):
-                self._setField(row, col, _getValue(values, col=col))
+                self._setField(row, col, _get1d(values, col))
         elif row is None:  # column replacement
             for row in range(len(values)):
-                self._setField(row, col, _getValue(values, row=row))
+                self._setField(row, col, _get1d(values, row))
         else:
             self._setField(row, col, values)
 
     @property
     def data(self):
         """ A list of the current data in the grid """
-        values = []
-        for row in range(self._shape[0]):
-            curRow = []
-            for col in range(self._shape[1]):
-                if isinstance(self._fields[row][col], tk.Entry):
-                    curRow.append(self._fields[row][col].get())
-                elif isinstance(self._fields[row][col], tk.Text,):
-                    curRow.append(self._fields[row][col].get("1.0", tk.END))
-                else:
-                    curRow.append(self._data[row][col])
-            values.append(curRow)
-        return values
+        self._readEntries()
+        return [list(curRow) for curRow in self._data]
+
+    @data.setter
+    def data(self, values):
+        # Only cells whose value differs are written; cells missing from values are left as is
+        self._readEntries()
+        (nrows, ncols) = self._shape
+        for (row, rowValues) in enumerate(values[:nrows]):
+            curRow = self._data[row]
+            for (col, value) in enumerate(rowValues[:ncols]):
+                if value != curRow[col]:
+                    self._setField(row, col, value)
 
     
 class LocalDataDialog(): 
@@ -650,7 +725,7 @@ class LocalDataDialog():
             self._popup = None
 
     def update(self, **kw):
-        return self._entryFrame.update(kw)
+        return self._entryFrame.update(**kw)
         
     @property
     def data(self):
@@ -722,6 +797,7 @@ class LocalTableDialog(tk.Frame):
     """
 
     def __init__(self, parent=None, dataframe=None, title='obTable'):
+        import pandastable as pt  # Deferred, only the table dialog needs the pandastable stack
         self._popup = tk.Toplevel(parent)
         self._popup.geometry('600x400')
         self._popup.title(title)
@@ -736,7 +812,7 @@ class LocalTableDialog(tk.Frame):
         self._table.textcolor = 'red' 
         self._popup.takefocus = True
         self._popup.grab_set()
-        _place_window(self._popup, self.parents)
+        _place_window(self._popup, self.parent)
         self._table.show()
         return
 
@@ -750,17 +826,18 @@ class LocalButtonFrame(tk.Frame):
         parent (tkinter.Tk) : Optional parent window
         cnf (dict) : Optional configuration parameters for the frame
         shape (tuple) : (nrows, ncols) giving shape of grid; default = (1,1)
-        commands (list} : list containing the commands for each button in the grid
+        commands (list} : list containing the commands for each button in the grid,
+                          or a single callable f(row, col) shared by every button
         labels (list) : list containing the text for each button in the grid
+                        data and commands may also be sparse {(row, col): value} dicts, in which case
+                        only the cells present in either dict get a button
         rowbg (list) : list containing the background color for each row (default is 'white')
+        underlines (list) : Optional list containing the index of the character to underline in each button
+                            (default is -1, no underline)
 
     Examples:
     
-        commands = [[lambda: self._inc(0)], [lambda: self._inc(1)], [lambda: self._inc(2)], [lambda: self._inc(3)], [lambda: self._inc(4)],
-                    [lambda: self._inc(5)], [lambda: self._inc(6)], [lambda: self._inc(7)], [lambda: self._inc(8)], [lambda: self._inc(9)],
-                    [lambda: self._inc(10)], [lambda: self._inc(11)], [lambda: self._inc(12)], [lambda: self._inc(13)], [lambda: self._inc(14)],
-                    [lambda: self._inc(15)], [lambda: self._inc(16)], [lambda: self._inc(17)], [lambda: self._inc(18)], [lambda: self._inc(19)],
-                    [lambda: self._inc(20)], [lambda: self._inc(21)], ]
+        commands = [[partial(self._inc, row)] for row in range(skillshape[0])]
         self._buttons = LocalButtonFrame(parent, shape=skillshape, rowbg=rowbg,
                                       labels=[ ['Inc'] for y in range(skillshape[0])] ,
                                       commands=commands,)
@@ -768,35 +845,61 @@ class LocalButtonFrame(tk.Frame):
         
     """
 
-    def __init__(self, parent=None, cnf=None, shape=(1, 1), commands:list=[], data=[], rowbg=[], font=None):
-        if parent is None: parent = tk.Tk()
-        self.master = parent
-        self._buttons = [[None for _ in range(shape[1])] for _ in range(shape[0])]
+    def __init__(self, parent=None, cnf=None, shape=(1, 1), commands:list=[], data=[], rowbg=[], font=None,
+                 underlines:list=[]):
         self._shape = (nrows, ncols) = shape
-        self._font = font
+        self._buttons = [None] * (nrows * ncols)  # flat, indexed by row * ncols + col
         
         self._commands = commands
         self._rowbg = rowbg
         self._data = data
 
-        tk.Frame.__init__(self)
-        if cnf is not None: self.configure(cnf)
+        tk.Frame.__init__(self, parent, cnf or {})
+        if font is not None and not isinstance(font, tkfont.Font):
+            font = tkfont.Font(root=self, font=font)  # parse a font spec once for every button
+        self._font = font
+        rowColors = list(rowbg[:nrows]) + ['white'] * (nrows - len(rowbg))
+        (Button, call) = (tk.Button, self.tk.call)
+        sparse = [source for source in (data, self._commands) if isinstance(source, dict)]
+        cells = set().union(*sparse) if sparse else None
         for row in range(nrows):
+            (bg, base) = (rowColors[row], row * ncols)
+            rowTexts = [_get2d(data, row, col, '') for col in range(ncols)]
+            if callable(self._commands):
+                rowCommands = [partial(self._commands, row, col) for col in range(ncols)]
+            else:
+                rowCommands = [_get2d(self._commands, row, col) for col in range(ncols)]
+            rowUnderlines = [_get2d(underlines, row, col, -1) for col in range(ncols)]
             for col in range(ncols):
-                self._buttons[row][col] = tk.Button(self, underline=row,
-                                                    text=_getValue(self._data, row=row, col=col, default=''),
-                                                    bg=_getValue(self._rowbg, row=row, default='white'),
-                                                    command=_getValue(self._commands, row=row, col=col),
-                                                    font=font)
-                self._buttons[row][col].grid(row=row, column=col, sticky='nsew', padx=1, pady=1)
-                self.grid(row=row, column=col, sticky='nsew')
-        for row in range(nrows):
-            self.rowconfigure(row, weight=1)
-        for col in range(ncols):
-            self.columnconfigure(col, weight=0)
-        
-        return
+                if cells is not None and (row, col) not in cells:
+                    continue
+                button = self._buttons[base + col] = Button(self, underline=rowUnderlines[col], text=rowTexts[col],
+                                                            bg=bg, command=rowCommands[col], font=font)
+                # Same as button.grid(...) without building and converting an options dict per cell
+                call('grid', 'configure', button._w, '-row', row, '-column', col, '-sticky', 'nsew', '-padx', 1, '-pady', 1)
+        # grid accepts a list of indices, so each weight is set with a single Tcl call
+        if nrows:
+            self.rowconfigure(tuple(range(nrows)), weight=1)
+        if ncols:
+            self.columnconfigure(tuple(range(ncols)), weight=0)
     
+    def button(self, row, col):
+        """ The tk.Button at row, col (None for an empty sparse cell) """
+        return self._buttons[row * self._shape[1] + col]
+
+    def update_cells(self, changes:dict):
+        """ Reconfigure several buttons in one call
+
+        Args:
+            changes (dict) : {(row, col): {option: value, ...}} of the button options to change
+        """
+        ncols = self._shape[1]
+        for ((row, col), options) in changes.items():
+            button = self._buttons[row * ncols + col]
+            if button is None:
+                raise KeyError(f'No button at row {row}, column {col}')
+            button.configure(**options)
+
     def _nocommand(self):
         messagebox.showwarning('No Command Set', 'No Button Command Set')
 
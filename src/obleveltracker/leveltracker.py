@@ -16,10 +16,14 @@ import csv
 import sqlite3
 import configparser
 
-import pyautogui
+from collections import deque
+from contextlib import closing
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+
 import argparse
 import logging
-import pandas as pd
 import tkinter as tk
 
 from tkinter import messagebox, filedialog as fd
@@ -31,6 +35,52 @@ from obleveltracker.datadialogs import (LocalDataFrame,
                                         askinteger,
                                         askstring,)
 
+_UPDATE_SKILL_MAJOR = 'update obSkills set major = ? where ROWID = ?'
+_UPDATE_STATS_BY_ROWID = 'update obStats set curvalue = ? where ROWID = ?'
+_UPDATE_STATS_BY_LEVEL = 'update obStats set curvalue = ? where SKILLID = ? and level = ?'
+_UPDATE_ATTRS_BY_LEVEL = 'update obAttrs set curvalue = ? where ATTRID = ? and level = ?'
+_INSERT_STATS = 'insert into obStats (SKILLID, level, curvalue, prevalue) VALUES (?,?,?,?)'
+_INSERT_LEVEL = 'insert or ignore into obStats (SKILLID, level, curvalue, prevalue) select ROWID, ?, 0, 0 from obSkills'
+_INSERT_ATTRS = 'insert into obAttrs (curvalue, ATTRID, level) VALUES (?,?,?)'
+_SELECT_LEVEL = 'select skill, curValue from statsMap where level = ? order by Majorskill DESC, Sortorder ASC'
+# Migration for databases created before create_obdb.sql gained the per-level indexes: the
+# UNIQUE(SKILLID, level) and UNIQUE(ATTRID, level) indexes lead with the key, so the per-level
+# lookups and max(level) need their own. A no-op on files that already have them.
+_INDEX_SCRIPT = '''
+    CREATE INDEX IF NOT EXISTS obStatsLevel ON obStats(level, SKILLID);
+    CREATE INDEX IF NOT EXISTS obAttrsLevel ON obAttrs(level, ATTRID);
+'''
+_FILETYPES = (('DB files', '*.db'), ('All files', '*.*'))
+_RECENT_MAX = 10  # one Recent menu command per entry
+_PAGE_CACHE_KIB = 65536  # default page cache, [default] sqliteCacheKiB in the config overrides it
+# journal_mode=WAL is stored in the database file and persists after close
+_CONNECTION_PRAGMAS = ('journal_mode=WAL',
+                       'synchronous=NORMAL',
+                       'temp_store=MEMORY',
+                       'mmap_size=268435456',)
+
+
+def _readScript(name):
+    """ Return the contents of an SQL script shipped alongside this module """
+    with open(os.path.join(os.path.dirname(__file__), name), 'r') as f:
+        return f.read()
+
+
+def _connect(filename, cacheKiB=_PAGE_CACHE_KIB):
+    """ Open filename with the PRAGMAs used for every connection """
+    conn = sqlite3.connect(filename)
+    try:
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(f'PRAGMA {pragma}')
+        conn.execute(f'PRAGMA cache_size=-{int(cacheKiB)}')  # negative means KiB rather than pages
+    except sqlite3.Error as e:
+        logger.info(f'Unable to tune {filename}: {e}')
+    return conn
+
+
+_CREATE_SCRIPT = _readScript('create_obdb.sql')
+_INSERT_SCRIPT = _readScript('insert_obdb.sql')
+
 
 def get_args():
     """ Parse and return command line arguments
@@ -239,25 +289,31 @@ class rootWindow(tk.Frame):
         self._skillsmap = None
         self._curLevel = None
         self._dbName = None
+        self._conn = None
+        self._connOpen = False
+        self._refCache = {}
+        self._pendingRows = set()
+        self._refreshScheduled = False
+        self._frameKey = None
+        self._frameWidgets = []
         self._selectList = None
         self._notesDialog = None
-        self._dirty = [ 0 ]
+        self._dirty = set()
         self._levelsInc = 0
-        self._filetypes = (('DB files', '*.db'), ('All files', '*.*'))
         self._environ = dict(os.environ)
         self._homeDir = self._environ.get('HOMEPATH', self._environ.get('HOME', ''))
         self._cfgFname = os.path.join(self._homeDir, ".oblevel.ini")
         
-        self._incCommands = [[lambda: self._inc(0)], [lambda: self._inc(1)], [lambda: self._inc(2)], [lambda: self._inc(3)], [lambda: self._inc(4)],
-            [lambda: self._inc(5)], [lambda: self._inc(6)], [lambda: self._inc(7)], [lambda: self._inc(8)], [lambda: self._inc(9)],
-            [lambda: self._inc(10)], [lambda: self._inc(11)], [lambda: self._inc(12)], [lambda: self._inc(13)], [lambda: self._inc(14)],
-            [lambda: self._inc(15)], [lambda: self._inc(16)], [lambda: self._inc(17)], [lambda: self._inc(18)], [lambda: self._inc(19)],
-            [lambda: self._inc(20)], ]
-        self._recentCommands = [lambda: self._openRecent(0), lambda: self._openRecent(1), lambda: self._openRecent(2),
-                                lambda: self._openRecent(3), lambda: self._openRecent(4), lambda: self._openRecent(5),
-                                lambda: self._openRecent(6), lambda: self._openRecent(7), lambda: self._openRecent(8),
-                                lambda: self._openRecent(9), ]
+        self._incCommands = [[partial(self._inc, row)] for row in range(21)]
+        self._recentCommands = [partial(self._openRecent, idx) for idx in range(_RECENT_MAX)]
         self._incButtonHotkeys = []
+        self._incMenuKey = None
+        self._incLabels = []
+        self._incByChar = {}
+        self._recentDirty = True
+        self._saveBound = False
+        self._menuState = None
+        self._ctrlDispatch = {'N': self._newDB, 'O': self._openDB, 'S': self._saveDB, 'Q': self._quit, }
         if parent is None: parent = tk.Tk()
         self._config = self._getConfig()
 
@@ -267,11 +323,10 @@ class rootWindow(tk.Frame):
         
         # Place the window at the current mouse position, supports multiple monitors best
         self.main.geometry(f'{self._width}x{self._height}')
-        mousepos = pyautogui.position()
+        mousepos = self.main.winfo_pointerxy()
         self.main.wm_geometry(f'+{mousepos[0]}+{mousepos[1]}')
         self.main.title(title)
         self.main['bg'] = '#D3B683'
-        self.font = tk.font.nametofont("TkDefaultFont").actual()
         self.main.protocol("WM_DELETE_WINDOW", self._quit)
         parent.bind("<Configure>", self._on_window_resize)      
         self._setupMenu()
@@ -292,10 +347,10 @@ class rootWindow(tk.Frame):
     def _getConfig(self):
         self._config = configparser.ConfigParser()
         self._config.optionxform = str
-        self._tkDefaultFont = tk.font.nametofont("TkDefaultFont")
         self._defaultFont = tk.font.Font()
         self._attrFont = tk.font.Font()
         self._notesConfig = {'font': tk.font.Font(), 'fname': os.path.join(self._homeDir, "notes.csv")}
+        self._sqliteCacheKiB = _PAGE_CACHE_KIB
         try:
             if os.path.isfile(self._cfgFname):
                 self._config.read(self._cfgFname)
@@ -327,19 +382,35 @@ class rootWindow(tk.Frame):
                 else:
                     self._notesConfig['widths'] = [ widthStr ]
                 
-        except configparser.Error as e:
+        except (configparser.Error, ValueError) as e:
+            messagebox.showerror('Config Error', f'Configuration File Error\n{e}')
+        # Parsed on its own so a bad value only falls back to the default cache size
+        try:
+            cacheKiB = self._config.getint('default', 'sqliteCacheKiB', fallback=_PAGE_CACHE_KIB)
+            if cacheKiB <= 0:
+                raise ValueError(f'sqliteCacheKiB must be a positive number of KiB, not {cacheKiB}')
+            self._sqliteCacheKiB = cacheKiB
+        except (configparser.Error, ValueError) as e:
             messagebox.showerror('Config Error', f'Configuration File Error\n{e}')
         self._width = self._config.get('main', 'width', fallback='1860')   
         self._height = self._config.get('main', 'height', fallback='1175')   
         self._recentFiles = self._config.get('RecentFiles', 'files', fallback='')
-        self._recentList = self._recentFiles.split('\n')
-        while '' in self._recentList:
-            self._recentList.remove('')
+        self._recentList = deque(islice((fname for fname in self._recentFiles.split('\n') if fname), _RECENT_MAX),
+                                 maxlen=_RECENT_MAX)
          
         return self._config
 
     def _drawFrame(self):
-        if self._dbName is not None and os.path.isfile(self._dbName):
+        frameKey = (self._dbName, tuple(self._row2Skill), self._majorSkillCnt) if self._connOpen else None
+        if frameKey is not None and frameKey == self._frameKey:
+            # Same skills, order and majors, so the existing widgets only need new values
+            self._refreshFrame()
+            return
+        for widget in self._frameWidgets:
+            widget.destroy()
+        self._frameWidgets = []
+        self._frameKey = frameKey
+        if self._connOpen:
             # Some colors and default configurations
             desccnf = skillcnf = { 'bd':1, 'relief':'flat', 'bg':'#D3B683', }
 
@@ -361,7 +432,7 @@ class rootWindow(tk.Frame):
                               font=self._defaultFont)
             label2.grid(row=0, column=1, sticky='nsew')
             self._header2 = tk.Label(self.parent, font=self._defaultFont,
-                                     text=f'       {self._levelsInc*10}% to Next Level    -----   Current Level {self._curLevel} ', bg=skillcnf['bg'], anchor='w')
+                                     text=self._levelText(), bg=skillcnf['bg'], anchor='w')
             self._header2.grid(row=0, column=1, columnspan=2, sticky='nsew')
             
             self._skills = LocalDataFrame(self.parent, data=self._stats, shape=skillshape, cnf=skillcnf, rowbg=rowbg,
@@ -391,6 +462,8 @@ class rootWindow(tk.Frame):
             self.parent.columnconfigure(0, weight=0)
             self.parent.columnconfigure(1, weight=0)
             self.parent.columnconfigure(2, weight=1)
+            self._frameWidgets = [self._header1, self._header2, self._skills, self._buttons, self._desc,
+                                  self._attrs, self._attrdesc]
         else:
             self._header = None
             self._skills = None
@@ -402,139 +475,157 @@ class rootWindow(tk.Frame):
             self._attrdesc = None
         # self._checkMenu()
         return
+
+    def _refreshFrame(self):
+        """ Show the current level's values in the widgets built by _drawFrame """
+        self._header2.configure(text=self._levelText())
+        self._skills.data = self._stats
+        self._attrs.data = self._attrSums
     
     def _refreshData(self):
         if messagebox.askokcancel('Refresh Data', 'OK to refresh all data from database?'):
+            if self._dirty:
+                if messagebox.askyesno('Save Changes', 'Save Changes? Unsaved changes will be lost.'):
+                    self._saveDB(force=True)
+            self._refCache.clear()
+            self._initDataSets()
             self._drawFrame()
             
     def _initDataSets(self):
         self._sqls = {'skilldesc': 'select Skill, Attr, Skilldesc from skillMap order by MajorSkill Desc, sortorder Asc',
-              'skillkey': 'select ROWID, MajorSkill, underline from skillMap order by MajorSkill Desc, sortorder Asc',
-              'stats': 'select CurValue, Increase from statsMap where level = ? order by MajorSkill Desc, sortorder Asc',
+              'skillkey': 'select s.ROWID, s.name, s.major, s.underline, a.name from obSkills s '
+                          'left join obAttributes a on s.ATTRID = a.ROWID order by s.major Desc, s.sortorder Asc',
+              'stats': 'select ROWID, CurValue, Increase from statsMap where level = ? order by MajorSkill Desc, sortorder Asc',
               'attrdesc': 'select name, desc  from obAttributes order by name Asc',
               'attrvals': 'select curvalue, name from attrsMap where level = ? order by name',
               'underlines': 'select name, underline from skillMap order by MajorSkill Desc, Skill Asc',
-              'attrkey': 'select ROWID from obAttributes order by name Asc',
-              'statskey': 'select ROWID from statsMap where level = ? order by MajorSkill Desc, sortorder Asc',
-              'attrsum': f'select sum(CurValue) as CurValue, sum(Increase) as Increase from statsMap where level = ? '
-                         f'group by Attr order by Attr asc'
+              'attrkey': 'select ROWID, name from obAttributes order by name Asc',
               }
         if self._dbName is None: return
     
-        keymap = self._getDataList('select skill, attr from skillMap',)
-        self._skill2attr = {}
-        for row in keymap:
-            self._skill2attr[row[0]] = row[1]
-
-        keymap = self._getDataList('select ROWID, name from obAttributes')
-        self._attr2key = {}
-        self._key2attr = {}
-        for row in keymap:
-            self._key2attr[row[0]] = row[1]
-            self._attr2key[row[1]] = row[0]
-        
-        keymap = self._getDataList('select ROWID, name from obSkills')
-        self._dirty = [ 0 for _ in range(len(keymap))]
-        self._skill2key = {}
-        self._key2skill = {}
-        for row in keymap:
-            self._key2skill[row[0]] = row[1]
-            self._skill2key[row[1]] = row[0]
-            
-        self._skilldesclist = self._getDataList(self._sqls['skilldesc'])
-        self._attrdesclist = self._getDataList(self._sqls['attrdesc'])
-
-        keymap = self._getDataList(self._sqls['skillkey'])
-        self._skillKey2Row = [ [] for _ in range(len(keymap)) ]
-        self._row2SkillKey = [ [] for _ in range(len(keymap)) ]
-        self._minorList = []
-        self._majorList = []
-        self._row2Underline = []
-        for i in range(len(keymap)):
-            self._row2Underline.append(keymap[i][2])
-            key = keymap[i][0]
-            self._skillKey2Row[key] = i
-            self._row2SkillKey[i] = key
-            if keymap[i][1]:
-                self._majorList.append(self._key2skill[key])
-            else:
-                self._minorList.append(self._key2skill[key])
+        attrkeys = self._getRefData('attrkey')
+        self._attr2key = {name: key for (key, name) in attrkeys}
+        attr2row = {name: row for row, (_, name) in enumerate(attrkeys)}
+
+        self._dirty = set()
+        self._skilldesclist = self._getRefData('skilldesc')
+        self._attrdesclist = self._getRefData('attrdesc')
+
+        skillkeys = self._getRefData('skillkey')
+        (self._row2SkillKey, self._row2Skill, majors, self._row2Underline, attrs) = (list(col) for col in zip(*skillkeys))
+        self._skill2key = dict(zip(self._row2Skill, self._row2SkillKey))
+        self._row2AttrRow = [attr2row[attr] for attr in attrs]
+        self._majorList = [skill for (skill, major) in zip(self._row2Skill, majors) if major]
+        self._minorList = [skill for (skill, major) in zip(self._row2Skill, majors) if not major]
         self._majorSkillCnt = len(self._majorList)
-                        
-        keymap = self._getDataList(self._sqls['attrkey'])
-        self._attr2row = [  [] for _ in range(len(keymap)) ]
-        self._row2attr = [ [] for _ in range(len(keymap)) ]
-        rowcnt = 0
-        for row in keymap:
-            self._attr2row[row[0]] = rowcnt
-            self._row2attr[rowcnt] = row[0]
-            rowcnt += 1
 
         if self._curLevel is None:
-            levels = self._getDataList('select max(level) from obStats')
-            self._curLevel = levels[0][0]
+            self._curLevel = self._getDataColumn('select max(level) from obStats')[0]
         
         self._attrVals = self._getDataList(self._sqls['attrvals'], (self._curLevel,))
-        self._stats = self._getDataList(self._sqls['stats'], (self._curLevel,))
-        self._levelsInc = sum([x[1] for x in self._stats[:self._majorSkillCnt]])
-        keymap = self._getDataList(self._sqls['statskey'], (self._curLevel,))
-        self._stats2row = {}
-        self._row2StatsKey = [[] for x in range(len(keymap))]
-        rowcnt = 0
-        for row in keymap:
-            self._stats2row[row[0]] = rowcnt
-            self._row2StatsKey[rowcnt] = row[0]
-            rowcnt += 1
-
-        self._attrSums = self._getDataList(self._sqls['attrsum'], (self._curLevel,))
-        for row in range(len(self._attrSums)):
-            self._attrSums[row] = [self._attrVals[row][0], self._attrSums[row][1]]
+        self._stats = []
+        self._row2StatsKey = []
+        for (key, curValue, increase) in self._getDataList(self._sqls['stats'], (self._curLevel,)):
+            self._stats.append([curValue, increase])
+            self._row2StatsKey.append(key)
+        self._levelsInc = sum(map(itemgetter(1), islice(self._stats, self._majorSkillCnt)))
+
+        self._attrSums = [[curValue, 0] for (curValue, _) in self._attrVals]
+        for row, (_, increase) in enumerate(self._stats):
+            self._attrSums[self._row2AttrRow[row]][1] += increase
         if self._curLevel is None: self._curLevel = 0
             
     def _inc(self, x):
         """ Increment the value of skill in row x """
-        key = self._row2SkillKey[x]
-        skill = self._key2skill[key]
-        attrkey = self._attr2key[ self._skill2attr[skill] ]
+        skill = self._row2Skill[x]
         if messagebox.askyesno('Increase Skill', f'Increment {skill}?'):
-            self._stats[x] = (self._stats[x][0] + 1, self._stats[x][1] + 1)
-            self._skills.update(row=x, data=(self._stats[x]))
-            self._attrSums[attrkey] = (self._attrSums[attrkey][0], self._attrSums[attrkey][1] + 1)
-            self._attrs.update(row=attrkey, data=self._attrSums[attrkey])
-            self._dirty[x] = 1
+            stats = self._stats[x]
+            stats[0] += 1
+            stats[1] += 1
+            self._attrSums[self._row2AttrRow[x]][1] += 1
+            self._dirty.add(x)
             if x < self._majorSkillCnt:
                 self._levelsInc += 1
-            self._checkMenu()
-            self._drawFrame()
+            self._scheduleRefresh(x)
+
+    def _scheduleRefresh(self, row):
+        """ Queue row for redisplay; all rows queued before the next idle are drawn together """
+        self._pendingRows.add(row)
+        if not self._refreshScheduled:
+            self._refreshScheduled = True
+            self.parent.after_idle(self._flushRefresh)
+
+    def _flushRefresh(self):
+        self._refreshScheduled = False
+        for row in self._pendingRows:
+            self._skills.update(row=row, data=self._stats[row])
+            attrRow = self._row2AttrRow[row]
+            self._attrs.update(row=attrRow, data=self._attrSums[attrRow])
+        self._pendingRows.clear()
+        self._header2.configure(text=self._levelText())
+        self._checkMenu()
+
+    def _levelText(self):
+        return f'       {self._levelsInc*10}% to Next Level    -----   Current Level {self._curLevel} '
         
-    def _getDataList(self, sql, params=None):
-        if self._dbName is not None and os.path.isfile(self._dbName): 
+    def _getDataList(self, sql, params=()):
+        if self._connOpen:
             try:
-                with sqlite3.connect(self._dbName) as conn:
-                    if params is not None:
-                        cursor = conn.execute(sql, params)
-                    else:
-                        cursor = conn.execute(sql)
-                    datalist = cursor.fetchall()
-                return datalist
+                return list(self._conn.execute(sql, params))
             except sqlite3.Error as e:
                 messagebox.showerror('SQL error', f'Error in {sql}\n{str(e)}')
 
+    def _getDataColumn(self, sql, params=()):
+        """ Return the first column of each result row as a flat list """
+        if self._connOpen:
+            try:
+                cursor = self._conn.cursor()
+                cursor.row_factory = lambda _, row: row[0]
+                return cursor.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                messagebox.showerror('SQL error', f'Error in {sql}\n{str(e)}')
+
+    def _getRefData(self, key):
+        """ Return the static reference query self._sqls[key], cached until the skills are edited """
+        if key not in self._refCache:
+            self._refCache[key] = self._getDataList(self._sqls[key])
+        return self._refCache[key]
+
     def _getDataFrame(self, sql):
+        import pandas as pd  # Deferred, only the SQL query window needs pandas
+        # sqlite3 errors propagate so _showSQL reports them and skips the table window
+        with self._conn:
+            cursor = self._conn.execute(sql)
+            # SQLite columns are already typed, so skip read_sql_query's per-column inference
+            columns = [desc[0] for desc in cursor.description or ()]
+            df = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+        return df
+
+    def _openConnection(self, filename):
+        """ Replace the application connection with one to filename """
+        self._closeConnection()
+        self._refCache.clear()
+        self._conn = _connect(filename, self._sqliteCacheKiB)
+        self._connOpen = True
         try:
-            with sqlite3.connect(self._dbName) as conn:
-                df = pd.read_sql(sql, conn)
-            return df
+            self._conn.executescript(_INDEX_SCRIPT)
         except sqlite3.Error as e:
-            messagebox.showerror('SQL error', f'Error in {sql}\n{str(e)}')
+            logger.info(f'Unable to index {filename}: {e}')
+
+    def _closeConnection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._connOpen = False
 
     def _doNothing(self):
         messagebox.showwarning('rootWindow', 'Do Nothing Button Pressed')
     
     def _setDB(self, filename):
-        self._validDB = (self._dbName != filename) and (filename is not None and os.path.isfile(filename))
-        if self._validDB:
+        newDB = (self._dbName != filename) and (filename is not None and os.path.isfile(filename))
+        if newDB:
             (_, fname) = os.path.split(filename)
+            self._openConnection(filename)
             self._dbName = filename
             self.parent.title(f'Oblivion Levels {fname}')
             self._checkMenu()
@@ -551,7 +642,7 @@ class rootWindow(tk.Frame):
                 self._checkMenu()
         
     def _openDB(self, *args):  # pylint: disable=unused-argument
-        filename = fd.askopenfilename(parent=self.parent, title='Open Database', filetypes=self._filetypes)
+        filename = fd.askopenfilename(parent=self.parent, title='Open Database', filetypes=_FILETYPES)
         if filename and len(filename):
             if os.path.isfile(filename):
                 self._setDB(filename)
@@ -562,42 +653,35 @@ class rootWindow(tk.Frame):
 
     def _saveMajorList(self):
         if messagebox.askyesno('Save', 'Commit Major Skill Changes?'):
-            if sum(self._dirty) > 0:
-                self._saveDB()
+            if self._dirty:
+                self._saveDB(force=True)
+                if self._dirty:
+                    return  # the save failed and was reported, keep the unsaved values
+            minorParams = [(0, self._skill2key[skill]) for skill in self._minorList]
+            majorParams = [(1, self._skill2key[skill]) for skill in self._majorList]
             try:
-                with sqlite3.connect(self._dbName) as conn:
-                    for skill in self._minorList:
-                        conn.execute("update obSkills set major = 0 where ROWID = ?", (self._skill2key[skill],))
-                    for skill in self._majorList:
-                        conn.execute("update obSkills set major = 1 where ROWID = ?", (self._skill2key[skill],))
+                with self._conn:
+                    self._conn.executemany(_UPDATE_SKILL_MAJOR, minorParams)
+                    self._conn.executemany(_UPDATE_SKILL_MAJOR, majorParams)
+                self._refCache.clear()
             except sqlite3.Error as e:
-                messagebox.showerror('SQL error', f'Update on skill {skill} @ rowid {self._skill2key[skill]}\n'
+                messagebox.showerror('SQL error', f'Update on major skills {self._majorList}\n'
                                      f' failed with message\n{str(e)}')
-            self._drawFrame()
+            else:
+                self._initDataSets()  # Majors sort first, so reload the rows in their new order
+                self._drawFrame()
         
     def _levelInsert(self, level):
-        levels = []
-        try:
-            with sqlite3.connect(self._dbName) as conn:
-                for rowid, skill in self._key2skill.items():
-                    conn.execute('insert into obStats (SKILLID, level, curvalue, prevalue) VALUES (?,?,0,0)', (rowid, level,))
-                    levels.append([skill, 0, ])
-            return levels
-        except sqlite3.Error as e:
-            messagebox.showerror('SQL error', f'Insert {skill} @ level {level}\n'
-                                 f' failed with message\n{str(e)}')
-                
+        # Adds only the skills missing from level; UNIQUE(SKILLID, level) skips the rest
+        self._conn.execute(_INSERT_LEVEL, (level,))
+
     def _levelGet(self, level, create=True):
-        selectSQL = 'select skill, curValue from statsMap where level = ? order by Majorskill DESC, Sortorder ASC'
         try:
-            with sqlite3.connect(self._dbName) as conn:
-                cursor = conn.execute(selectSQL, (level,))
+            with self._conn:
+                if create:
+                    self._levelInsert(level)
+                cursor = self._conn.execute(_SELECT_LEVEL, (level,))
                 levels = cursor.fetchall()
-                if create and len(levels) < 21:
-                    levels = self._levelInsert(level)
-                    cursor = conn.execute(selectSQL, (level,))
-                    levels = cursor.fetchall()
-                    
             return levels
         
         except sqlite3.Error as e:
@@ -609,8 +693,8 @@ class rootWindow(tk.Frame):
                             default=self._curLevel)
         if level is not None:
             try:
-                with sqlite3.connect(self._dbName) as conn:
-                    cursor = conn.execute('select skill, curValue from statsMap where level = ?', (level,))
+                with self._conn:
+                    cursor = self._conn.execute('select skill, curValue from statsMap where level = ?', (level,))
                     levels = cursor.fetchall()
                     if len(levels) == 21:
                         self._curLevel = level
@@ -627,62 +711,49 @@ class rootWindow(tk.Frame):
         level = askinteger('Level to Edit', 'Enter the Level to Edit', parent=self.parent,
                             default=self._curLevel, font=self._defaultFont)
         if level is not None:
-            if sum(self._dirty):
+            if self._dirty:
                 if messagebox.askyesno('Save Changes', 'Save Changes? Unsaved changes will be lost.'):
                     self._saveDB(force=True)
             levels = self._levelGet(level)
             myEntry = LocalDataDialog(self.parent, cnf={'bg':'#D3B683'}, font=self._defaultFont)
             if myEntry.show(data=levels, editcols=[1, 2, ], cnf={ 'bd':1, 'relief':'flat', 'bg':'#D3B683', }):
                 try:
-                    newStats = myEntry.data
-                    with sqlite3.connect(self._dbName) as conn:
-                        for row in newStats:
-                            _name = row[0]
-                            conn.execute('update obStats set curvalue=? where SKILLID = ? and level = ?',
-                                         (row[1], self._skill2key[row[0]], level))
+                    with self._conn:
+                        self._conn.executemany(_UPDATE_STATS_BY_LEVEL, [(curValue, self._skill2key[skill], level)
+                                                                        for (skill, curValue) in myEntry.data])
                         if myEntry.show(data=self._attrVals, editcols=[0, ], widths=[10, 20, ]):
-                            newAttrs = myEntry.data
-                            for row in newAttrs:
-                                _name = self._attrVals[1]  # for Exception below
-                                conn.execute('update obAttrs set curvalue=? where ATTRID = ? and level = ?',
-                                             (row[0], self._attr2key[row[1]], level,))
+                            self._conn.executemany(_UPDATE_ATTRS_BY_LEVEL, [(curValue, self._attr2key[attr], level)
+                                                                            for (curValue, attr) in myEntry.data])
                     self._curLevel = level
                     self._initDataSets()
                     self._checkMenu()
                     self._drawFrame()
                 except sqlite3.Error as e:
-                    messagebox.showerror('SQL error', f'Update Level {level} skill {_name}\n'
+                    messagebox.showerror('SQL error', f'Update Level {level}\n'
                                          f' failed with message\n{str(e)}')
                 
     def _levelUp(self):
         # Save current level and setup next level in database
         if messagebox.askyesno('Level Up', f'Save Level {self._curLevel} and Level Up?'):
             self._saveDB(force=True)
+            nextLevel = self._curLevel + 1
             try:
-                with sqlite3.connect(self._dbName) as conn:
-                    for curStats in [ (i, self._row2SkillKey[i]) for i in range(len(self._row2SkillKey))]: 
-                        (row, statRowId) = curStats
-                        params = (statRowId, self._curLevel + 1, self._stats[row][0], self._stats[row][0])
-                        conn.execute('INSERT INTO obStats (SKILLID,level,curvalue, prevalue) VALUES (?,?,?,?)', params)
-                    for curAttr in [ (self._attrVals[i][0], self._attr2key[self._attrVals[i][1]])
-                                    for i in range(len(self._attrVals)) ]:
-                        params = (curAttr[0], curAttr[1], self._curLevel + 1)
-                        conn.execute('INSERT INTO obAttrs (curvalue,ATTRID,level) VALUES (?,?,?)', params)
+                with self._conn:
+                    self._conn.executemany(_INSERT_STATS, ((skillKey, nextLevel, stats[0], stats[0])
+                                                           for skillKey, stats in zip(self._row2SkillKey, self._stats)))
+                    self._conn.executemany(_INSERT_ATTRS, ((curValue, self._attr2key[name], nextLevel)
+                                                           for (curValue, name) in self._attrVals))
                 self._curLevel += 1
                 self._initDataSets()
                 myEntry = LocalDataDialog(self.parent, cnf={'bg':'#D3B683'})
                 if myEntry.show(data=self._attrVals, editcols=[0, ], widths=[10, 20, ]):
-                    with sqlite3.connect(self._dbName) as conn:
-                        newAttrs = myEntry.data
-                        for row in newAttrs:
-                            _name = row[1]  # for Exception below
-                            params = (row[0], self._attr2key[row[1]], self._curLevel,)
-                            conn.execute('update obAttrs set curvalue=? where ATTRID = ? and level = ?',
-                                         (row[0], self._attr2key[row[1]], self._curLevel,))
+                    with self._conn:
+                        self._conn.executemany(_UPDATE_ATTRS_BY_LEVEL, [(curValue, self._attr2key[attr], nextLevel)
+                                                                        for (curValue, attr) in myEntry.data])
                     self._initDataSets()
                 self._drawFrame()
             except sqlite3.Error as e:
-                messagebox.showerror('SQL error', f'Update on obStats(SKILLID,level,curvalue,prevalue)={params}\n'
+                messagebox.showerror('SQL error', f'Level Up to {nextLevel}\n'
                                      f' failed with message\n{str(e)}')
             self._drawFrame()
 
@@ -693,38 +764,30 @@ class rootWindow(tk.Frame):
             self._notesDialog = notesDialog(**self._notesConfig)
             
     def _saveDB(self, *args, force=False):
-        if force or messagebox.askyesno('Save', 'Commit all skill level changes?'):
+        if self._dirty and (force or messagebox.askyesno('Save', 'Commit all skill level changes?')):
+            rows = sorted(self._dirty)
+            params = [(self._stats[row][0], self._row2StatsKey[row]) for row in rows]
             try:
-                with sqlite3.connect(self._dbName) as conn:
-                    for row in range(len(self._dirty)):
-                        if self._dirty[row]:
-                            key = self._row2StatsKey[row]
-                            skill = self._skilldesclist[row][0]
-                            conn.execute('update obStats set curvalue = ? where ROWID = ? ', (self._stats[row][0], key))
-                            self._dirty[row] = 0
+                with self._conn:
+                    self._conn.executemany(_UPDATE_STATS_BY_ROWID, params)
+                self._dirty.clear()
             except sqlite3.Error as e:
-                messagebox.showerror('SQL error', f'Update on {skill} @ row {row} failed with message\n{str(e)}')
+                skills = [self._row2Skill[row] for row in rows]
+                messagebox.showerror('SQL error', f'Update on {skills} failed with message\n{str(e)}')
         self._checkMenu()
                 
     def _newDB(self, *args):
         filename = fd.asksaveasfilename(parent=self.parent, title='Create Database',
-                                        filetypes=self._filetypes, defaultextension='.db',
+                                        filetypes=_FILETYPES, defaultextension='.db',
                                         confirmoverwrite=False)
         if filename and len(filename):
             if not os.path.isfile(filename) and messagebox.askyesno('Create DB', f'Create New DB at\n\t{filename}'):
                 logger.debug(f'Create database {filename}')
-                (fpath, _) = os.path.split(__file__)
-                with open(f'{fpath}/create_obdb.sql', 'r') as f:
-                    filelist = f.readlines()
-                createscript = ' '.join(filelist)
-                with open(f'{fpath}/insert_obdb.sql', 'r') as f:
-                    filelist = f.readlines()
-                insertscript = ' '.join(filelist)
                 try:
-                    with sqlite3.connect(filename) as conn:
-                        res = conn.executescript(createscript)
+                    with closing(_connect(filename, self._sqliteCacheKiB)) as conn:
+                        res = conn.executescript(_CREATE_SCRIPT)
                         logger.debug(f'create script return {res}')
-                        res = conn.executescript(insertscript)
+                        res = conn.executescript(_INSERT_SCRIPT)
                         logger.debug(f'insert script return {res}')
                     self._setDB(filename)
                     self._drawFrame()
@@ -753,7 +816,7 @@ class rootWindow(tk.Frame):
             try:
                 df = self._getDataFrame(sql)
                 _ = LocalTableDialog(parent=self.parent, dataframe=df, title=f'Query: {sql}')
-            except (sqlite3.Warning, sqlite3.Error, pd.errors.DatabaseError) as e:
+            except (sqlite3.Warning, sqlite3.Error) as e:
                 messagebox.showerror('SQL error', f'Error in {sql}\n{str(e)}')
              
     def _selectMajorSkills(self):
@@ -767,34 +830,49 @@ class rootWindow(tk.Frame):
     def _setupIncMenu(self):
         self._incMenu = tk.Menu(self._menu, tearoff=0)
         self._menu.add_cascade(label='Skill-Up', menu=self._incMenu, underline=5)
+        # One binding for every Alt key; _incHotKey ignores chars without a skill so menu traversal still works
+        self.parent.bind('<Alt-KeyPress>', self._incHotKey)
         
     def _incHotKey(self, event):
-        self._inc(self._incKeyIndex[event.char.upper()])
+        command = self._incByChar.get(event.char)
+        if command is not None:
+            command()
 
     def _clearMenu(self, menu):
-        lastItem = menu.index(tk.END)
-        if lastItem is not None:
-            for _ in range(lastItem + 1):
-                menu.delete("end")
+        try:
+            menu.delete(0, tk.END)
+        except tk.TclError:
+            pass
         
     def _fillIncMenu(self):
-        # Delete any exisiting items
-        self._clearMenu(self._incMenu)
-        self._incKeyIndex = {}
-        buttonLabels = []
-        # Insert the increment menu items
-        for row in range(len(self._row2Underline)):
-            skill = self._skilldesclist[row][0]
-            underline = self._row2Underline[row]
-            self._incMenu.add_command(label=skill, command=self._incCommands[row][0], underline=underline)
-            buttonLabels.append(['Inc', ])
+        menuKey = (tuple(desc[0] for desc in self._skilldesclist), tuple(self._row2Underline))
+        if menuKey != self._incMenuKey:
+            # Skills or underlines changed, update the menu items and hotkeys
+            oldKey = self._incMenuKey
+            self._incMenuKey = menuKey
+            self._incLabels = ['Inc' if underline is None else skill[underline] for skill, underline in zip(*menuKey)]
+            if oldKey is not None and len(oldKey[0]) == len(menuKey[0]):
+                # Same number of rows (e.g. a major skill change), so reconfigure only the rows that moved
+                for row, item in enumerate(zip(*menuKey)):
+                    if item != (oldKey[0][row], oldKey[1][row]):
+                        (skill, underline) = item
+                        self._incMenu.entryconfigure(row, label=skill,
+                                                     underline=-1 if underline is None else underline)
+            else:
+                self._clearMenu(self._incMenu)
+                for row, (skill, underline) in enumerate(zip(*menuKey)):
+                    self._incMenu.add_command(label=skill, command=self._incCommands[row][0], underline=underline)
+            self._rebuildHotkeyIndex()
+        return [[label] for label in self._incLabels]
+
+    def _rebuildHotkeyIndex(self):
+        (skills, underlines) = self._incMenuKey
+        # Both cases map straight to the row's command so a keypress is a single lookup
+        self._incByChar = {}
+        for row, (skill, underline) in enumerate(zip(skills, underlines)):
             if underline is not None:
                 char = skill[underline]
-                buttonLabels[row][0] = char
-                self._incKeyIndex[char.upper()] = row
-                self.parent.bind(f'<Alt-KeyPress-{char.upper()}>', self._incHotKey)             
-                self.parent.bind(f'<Alt-KeyPress-{char.lower()}>', self._incHotKey)
-        return buttonLabels
+                self._incByChar[char.upper()] = self._incByChar[char.lower()] = self._incCommands[row][0]
 
     def _setupEditMenu(self):
         self._editMenu = tk.Menu(self._menu, tearoff=0)
@@ -810,24 +888,31 @@ class rootWindow(tk.Frame):
         self._menu.add_cascade(label='Edit', menu=self._editMenu, underline=0)
         
     def _setupRecentMenu(self, filename=None):
-        if filename in self._recentList:
-            self._recentList.remove(filename)
-        if filename:
-            self._recentList.insert(0, filename)
-            self._recentList = self._recentList[0:11]
+        if filename and (not self._recentList or self._recentList[0] != filename):
+            try:
+                self._recentList.remove(filename)
+            except ValueError:
+                pass  # a new file, maxlen drops the oldest entry below
+            self._recentList.appendleft(filename)
+            self._saveConfig()
+        # The menu items are rebuilt when the Recent menu is next posted
+        self._recentDirty = True
+
+    def _maybeRebuildRecent(self):
+        if not self._recentDirty:
+            return
+        self._recentDirty = False
         self._clearMenu(self._recentMenu)
-        if len(self._recentList):
-            for idx, filename in zip(range(len(self._recentList)), self._recentList):
-                (_, fname) = os.path.split(filename)
-                self._recentMenu.add_command(label=f'{idx}: {fname}', underline=0, command=self._recentCommands[idx])
-        self._saveConfig()
+        for idx, filename in enumerate(self._recentList):
+            (_, fname) = os.path.split(filename)
+            self._recentMenu.add_command(label=f'{idx}: {fname}', underline=0, command=self._recentCommands[idx])
            
     def _setupFileMenu(self):
         self._fileMenu = tk.Menu(self._menu, tearoff=0)
         self._fileMenu.add_command(label="New", command=self._newDB, accelerator='Ctrl-N', underline=0)
         self._fileMenu.add_command(label="Open", command=self._openDB, accelerator='Ctrl-O', underline=0)
         self._fileMenu.add_command(label="Save", command=self._saveDB, accelerator='Ctrl-S', underline=0)
-        self._recentMenu = tk.Menu(self._fileMenu, tearoff=0)
+        self._recentMenu = tk.Menu(self._fileMenu, tearoff=0, postcommand=self._maybeRebuildRecent)
         self._fileMenu.add_cascade(label="Recent..", menu=self._recentMenu, underline=0)
         if len(self._recentList):
             self._setupRecentMenu()
@@ -838,55 +923,68 @@ class rootWindow(tk.Frame):
 
         self._fileMenu.add_command(label='Quit', command=self._quit, accelerator='Ctrl-Q', underline=0)
         self._menu.add_cascade(label='File', menu=self._fileMenu, underline=0)
-        self._bindHotkeys(self.parent, ['N', 'n', 'O', 'o', 'Q', 'q', ])
+        self._bindHotkeys(self.parent, [key for key in self._ctrlDispatch if key != 'S'])  # Save follows _dirty
         
     def _bindHotkeys(self, parent, keys):
-        for char in keys:
+        # Tk keysyms are case sensitive, so each key needs its shifted and unshifted binding
+        for char in {key.upper() for key in keys}:
             parent.bind(f'<Control-KeyPress-{char}>', self._hotkeyHandler)
+            parent.bind(f'<Control-KeyPress-{char.lower()}>', self._hotkeyHandler)
     
     def _unbindHotkeys(self, parent, keys):
-        for char in [keys]: 
+        for char in {key.upper() for key in keys}:
             parent.unbind(f'<Control-KeyPress-{char}>')
+            parent.unbind(f'<Control-KeyPress-{char.lower()}>')
 
     def _hotkeyHandler(self, event):
-        match event.keysym.upper():
-            case 'N':
-                self._newDB()
-            case 'O':
-                self._openDB()
-            case 'S':
-                self._saveDB()
-            case 'Q':
-                self._quit()
-            case _:
-                messagebox.showwarning('Unknown Hot Key', f'Unknown hotkey {event.keysym}')
+        command = self._ctrlDispatch.get(event.keysym.upper())
+        if command is not None:
+            command()
+        else:
+            messagebox.showwarning('Unknown Hot Key', f'Unknown hotkey {event.keysym}')
 
     def _checkMenu(self):
         STATES = { False: 'disabled', True: 'normal', }
-        dbValid = self._dbName is not None and os.path.isfile(self._dbName)
-        dbDirty = dbValid and (sum(self._dirty) > 0)
+        dbValid = self._connOpen
+        dbDirty = dbValid and bool(self._dirty)
         levelUp = (dbValid and self._levelsInc > 9)
         hasRecent = len(self._recentList) > 0
-        
+        menuState = (dbDirty, hasRecent, dbValid, levelUp)
+        if menuState == self._menuState:
+            return  # nothing to reconfigure
+        self._menuState = menuState
+
         self._fileMenu.entryconfigure(2, state=STATES[dbDirty])  # Save menu on if valid
         self._fileMenu.entryconfigure(3, state=STATES[hasRecent])  # Recent menu on if valid
         self._menu.entryconfigure(2, state=STATES[dbValid])  # Level menu only if valid
         self._menu.entryconfigure(3, state=STATES[dbValid])  # Inc menu online if dbValid
         self._editMenu.entryconfigure(0, state=STATES[levelUp])
         
-        if dbDirty:
-            self._bindHotkeys(self.parent, ['S', 's'])
-        else:
-            self._unbindHotkeys(self.parent, ['S', 's'])
+        if dbDirty != self._saveBound:
+            self._saveBound = dbDirty
+            if dbDirty:
+                self._bindHotkeys(self.parent, ['S'])
+            else:
+                self._unbindHotkeys(self.parent, ['S'])
                           
     def _quit(self, *args):
-        if sum(self._dirty) > 0:
-            if messagebox.askyesno('Save Changes', 'Save Changes to Database before exit?'):
+        if self._dirty:
+            # One prompt covers both save and quit: Yes saves, No discards, Cancel keeps running
+            save = messagebox.askyesnocancel('Quit', 'Save Changes to Database before exit?')
+            if save is None:
+                return
+            if save:
                 self._saveDB(force=True)
-        if messagebox.askokcancel('Quit', 'Exit: Are you sure?'):
-            self.main.destroy()
+                if self._dirty:
+                    return  # the save failed and was reported, keep the changes
+        elif not messagebox.askokcancel('Quit', 'Exit: Are you sure?'):
+            return
+        self._closeConnection()
+        self.main.destroy()
 
     def _on_window_resize(self, event):
+        if event.widget is not self.parent:
+            return  # a bind on the root window also fires for every child widget's <Configure>
         self._width = event.width
         self._height = event.height
         # print(f"Window resized to {width}x{height}")
@@ -0,0 +1,126 @@
+""" Unit tests for the datadialogs helpers that do not need a display """
+import os
+import sys
+import unittest
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from obleveltracker.datadialogs import (LocalButtonFrame, LocalDataFrame,  # noqa: E402
+                                        _get2d, _getRuns, _getShape)
+
+
+class TestGet2d(unittest.TestCase):
+
+    def test_list(self):
+        data = [[1, 2], [3, 4]]
+        self.assertEqual(_get2d(data, 1, 0), 3)
+        self.assertEqual(_get2d(data, 2, 0, 'x'), 'x')
+        self.assertEqual(_get2d(data, 0, 5, 'x'), 'x')
+
+    def test_ragged_and_empty(self):
+        self.assertEqual(_get2d([[1], []], 1, 0, 'x'), 'x')
+        self.assertEqual(_get2d([], 0, 0, 'x'), 'x')
+        self.assertIsNone(_get2d(None, 0, 0))
+
+    def test_not_2d(self):
+        self.assertEqual(_get2d([1, 2], 0, 0, 'x'), 'x')
+
+    def test_sparse_dict(self):
+        data = {(0, 1): 'a', (2, 0): 'b'}
+        self.assertEqual(_get2d(data, 0, 1), 'a')
+        self.assertEqual(_get2d(data, 2, 0), 'b')
+        self.assertEqual(_get2d(data, 1, 1, ''), '')
+
+
+class TestGetShape(unittest.TestCase):
+
+    def test_no_data(self):
+        self.assertEqual(_getShape((3, 4)), (3, 4))
+        self.assertEqual(_getShape((3, 4), []), (3, 4))
+
+    def test_shape_attribute(self):
+        class Frame:
+            shape = (5, 2)
+        self.assertEqual(_getShape(data=Frame()), (5, 2))
+
+    def test_callable_shape(self):
+        class Frame:
+            def shape(self):
+                return (6, 3)
+        self.assertEqual(_getShape(data=Frame()), (6, 3))
+
+    def test_rows(self):
+        self.assertEqual(_getShape(data=[[1, 2, 3], [4, 5, 6]]), (2, 3))
+        self.assertEqual(_getShape(data=[(1, 2), (3, 4)]), (2, 2))
+        Row = namedtuple('Row', 'a b c d')
+        self.assertEqual(_getShape(data=[Row(1, 2, 3, 4)]), (1, 4))
+
+    def test_flat(self):
+        self.assertEqual(_getShape(data=['a', 'b', 'c']), (3, 0))
+
+
+class TestGetRuns(unittest.TestCase):
+
+    def test_runs(self):
+        self.assertEqual(_getRuns([]), [])
+        self.assertEqual(_getRuns([4]), [[4, 4]])
+        self.assertEqual(_getRuns([0, 1, 2, 5, 7, 8]), [[0, 2], [5, 5], [7, 8]])
+
+
+class TestButtonFrame(unittest.TestCase):
+
+    def _frame(self, buttons):
+        frame = LocalButtonFrame.__new__(LocalButtonFrame)
+        frame._shape = (len(buttons), 1)
+        frame._buttons = buttons
+        return frame
+
+    def test_update_cells_empty_sparse_cell(self):
+        frame = self._frame([None])
+        with self.assertRaises(KeyError):
+            frame.update_cells({(0, 0): {'text': 'x'}})
+
+    def test_update_cells_missing_cell(self):
+        frame = self._frame([None])
+        with self.assertRaises(IndexError):
+            frame.update_cells({(3, 0): {'text': 'x'}})
+
+
+class TestDataFrame(unittest.TestCase):
+    # Plain objects stand in for the widgets, so _setField only records the value
+
+    def _frame(self, data):
+        frame = LocalDataFrame.__new__(LocalDataFrame)
+        frame._shape = (nrows, ncols) = (len(data), len(data[0]))
+        frame._ncols = ncols
+        frame._fields = [object() for _ in range(nrows * ncols)]
+        frame._data = [list(row) for row in data]
+        frame._entryCells = []
+        return frame
+
+    def test_update_rows(self):
+        frame = self._frame([[1, 2], [3, 4], [5, 6]])
+        frame.update(rows=[(0, ['a', 'b']), (2, ['c'])])
+        self.assertEqual(frame.data, [['a', 'b'], [3, 4], ['c', 6]])
+
+    def test_set_field_column_out_of_range(self):
+        frame = self._frame([[1, 2], [3, 4]])
+        with self.assertRaises(IndexError):
+            frame.update(rows=[(0, ['a', 'b', 'c'])])
+        with self.assertRaises(IndexError):
+            frame.update(row=0, col=-1, data='x')
+        self.assertEqual(frame.data[1], [3, 4])
+
+    def test_data_setter_writes_changes_only(self):
+        frame = self._frame([[1, 2], [3, 4]])
+        written = []
+        setField = frame._setField
+        frame._setField = lambda row, col, value: (written.append((row, col)), setField(row, col, value))
+        frame.data = [[1, 'b', 'extra'], [3, 4], [9, 9]]
+        self.assertEqual(written, [(0, 1)])
+        self.assertEqual(frame.data, [[1, 'b'], [3, 4]])
+
+
+if __name__ == '__main__':
+    unittest.main()
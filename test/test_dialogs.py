@@ -1,4 +1,3 @@
-import pyautogui
 import tkinter as tk
 from datadialogs import *
 
@@ -29,7 +28,7 @@ def main():
     global text
     top = tk.Tk()
     top.geometry("400x400")
-    mousepos = pyautogui.position()
+    mousepos = top.winfo_pointerxy()
     top.wm_geometry(f'+{mousepos[0]}+{mousepos[1]}')
     top.title('test LocalDialog')
     myDialog = LocalDialog(top)